@@ -1,47 +1,101 @@
 import os
+import re
 import sys
-import glob
-import shutil
+import errno
 import argparse
-import threading
 import subprocess
 
 from subprocess import PIPE
 
+from concurrent.futures import ThreadPoolExecutor
+
 from pathlib import Path
 from dataclasses import dataclass
 
 from io import TextIOWrapper
-from typing import TextIO, cast
+from typing import TextIO
+from typing import BinaryIO
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.terminalColors import RED
+from utils.terminalColors import RESET
 from utils.terminalColors import colorize
+from utils.terminalColors import termColor
 
-sysStdout = cast(TextIOWrapper, sys.stdout)
-sysStderr = cast(TextIOWrapper, sys.stderr)
+# Only reconfigure the streams when needed, reconfiguring flushes them
+if isinstance(sys.stdout, TextIOWrapper) and sys.stdout.encoding.lower() != "utf-8":
+    sys.stdout.reconfigure(encoding="utf-8")
 
-sysStdout.reconfigure(encoding="utf-8")
-sysStderr.reconfigure(encoding="utf-8")
+if isinstance(sys.stderr, TextIOWrapper) and sys.stderr.encoding.lower() != "utf-8":
+    sys.stderr.reconfigure(encoding="utf-8")
 
 VERSION = "2.6.1"
 
 TAB_WIDTH = 4
 TAB_CHAR = " " * TAB_WIDTH
 
+PIPE_SIZE = 1024 * 1024
+PIPE_CHUNK_SIZE = 65536
+
+OUTPUT_LINE_PREFIX = "[*] "
+ERROR_LINE_PREFIX = termColor(foreground=RED) + "[!] "
+ERROR_LINE_SUFFIX = RESET + "\n"
+
+VERSION_PARTS = VERSION.split(".")
+VERSION_TUPLE = tuple(int(versionPart) for versionPart in VERSION_PARTS) + (0,) * (4 - len(VERSION_PARTS))
+
+VERSION_REPLACEMENTS = {
+    "VERSION =": f'VERSION = "{VERSION}"',
+    "#define AppVersion": f'#define AppVersion "{VERSION}"',
+    "filevers=": f"{TAB_CHAR}filevers={VERSION_TUPLE},",
+    "prodvers=": f"{TAB_CHAR}prodvers={VERSION_TUPLE},",
+    'StringStruct("FileVersion"': f'{TAB_CHAR * 6}StringStruct("FileVersion", "{VERSION}"),  # Matches "File version"',
+    'StringStruct("ProductVersion"': (
+        f'{TAB_CHAR * 6}StringStruct("ProductVersion", "{VERSION}"),  # Matches "Product version"'
+    ),
+}
+"""Maps the key of each line matched by VERSION_LINES to its up-to-date replacement."""
+
 scriptDir = str(Path(__file__).parent)
 iconPath = str(Path(scriptDir).joinpath("resources", "icon.png"))
 versionPath = str(Path(scriptDir).joinpath("resources", "version_info.py"))
 workPath = str(Path(scriptDir).joinpath("generated", "build"))
 distPath = str(Path(scriptDir).joinpath("generated", "dist"))
+executablePath = str(Path(distPath).joinpath("PidCat.exe" if os.name == "nt" else "PidCat"))
+buildKeyPath = str(Path(distPath).joinpath(".buildkey"))
 generatedPath = str(Path(scriptDir).joinpath("generated"))
+pyinstallerCachePath = str(Path(scriptDir).joinpath(".pyinstaller-cache"))
 mainScript = str(Path(scriptDir).parent.joinpath("pidcat.py"))
 setupScriptPath = str(Path(scriptDir).joinpath("setup"))
 setupOutputPath = str(Path(setupScriptPath).joinpath("Output"))
 setupScript = str(Path(setupScriptPath).joinpath("setup.iss"))
 versionInfoScript = str(Path(scriptDir).joinpath("resources", "version_info.py"))
 
+PYINSTALLER_COMMAND = [
+    "pyinstaller",
+    "--onefile",
+    "--console",
+    "--log-level=WARN",
+    f"--workpath={workPath}",
+    f"--distpath={distPath}",
+    f"--specpath={generatedPath}",
+    f"--icon={iconPath}",
+    f"--version-file={versionPath}",
+    "--name=PidCat",
+    mainScript,
+]
+
+VERSION_LINES = {
+    mainScript: re.compile(r"^[ \t]*(VERSION =)[^\r\n]*", re.MULTILINE),
+    setupScript: re.compile(r"^[ \t]*(#define AppVersion)[^\r\n]*", re.MULTILINE),
+    versionInfoScript: re.compile(
+        r'^[ \t]*(filevers=|prodvers=|StringStruct\("(?:File|Product)Version")[^\r\n]*',
+        re.MULTILINE,
+    ),
+}
+"""Maps each file holding the version to the pattern matching its version lines."""
+
 
 @dataclass
 class CliArgs:
@@ -185,83 +239,98 @@ def createArgParser() -> argparse.ArgumentParser:
     return parser
 
 
-def updateMainScriptVersion() -> None:
+def getVersionLine(match: re.Match[str]) -> str:
     """
-    Updates the version string in the main script file.
+    Returns the up-to-date replacement for a line matched by one of the VERSION_LINES patterns.
 
-    This function reads the main script file, updates the version string, and writes the updated content back to the file.
+    Arguments:
+        match (re.Match[str]): The match of a version line.
     """
 
-    with open(file=mainScript, mode="r+", encoding="utf-8") as fileDescriptor:
-        lines = fileDescriptor.readlines()
+    return VERSION_REPLACEMENTS[match.group(1)]
 
-        fileDescriptor.seek(0)
-        fileDescriptor.truncate()
 
-        for line in lines:
-            if line.strip().startswith("VERSION"):
-                fileDescriptor.write(f'VERSION = "{VERSION}"\n')
-            else:
-                fileDescriptor.write(line)
+def updateVersionLines(path: str) -> None:
+    """
+    Updates the version lines of a file in a single pass.
 
+    This function reads the whole file and substitutes every line matched by the file's VERSION_LINES pattern.
+    The file is only written if its content changed, so a no-op update leaves its modification time intact.
+    The new content is written to a temporary file which then replaces the original, so an interrupted update never
+    leaves a partially written file behind.
 
-def updateSetupScriptVersion() -> None:
+    Arguments:
+        path (str): The path of the file to update.
     """
-    Updates the version string in the setup script file.
 
-    This function reads the setup script file, updates the version string, and writes the updated content back to the file.
-    """
+    with open(file=path, mode="r", encoding="utf-8", newline="") as fileDescriptor:
+        content = fileDescriptor.read()
 
-    with open(file=setupScript, mode="r+", encoding="utf-8") as fileDescriptor:
-        lines = fileDescriptor.readlines()
+    updatedContent = VERSION_LINES[path].sub(getVersionLine, content)
 
-        fileDescriptor.seek(0)
-        fileDescriptor.truncate()
+    if updatedContent == content:
+        return
 
-        for line in lines:
-            if line.strip().startswith("#define AppVersion"):
-                fileDescriptor.write(f'#define AppVersion "{VERSION}"\n')
-            else:
-                fileDescriptor.write(line)
+    temporaryPath = f"{path}.tmp"
+
+    with open(file=temporaryPath, mode="w", encoding="utf-8", newline="") as fileDescriptor:
+        fileDescriptor.write(updatedContent)
 
+    os.replace(temporaryPath, path)
 
-def updateVersionInfoScriptVersion() -> None:
+
+def updateVersions() -> None:
     """
-    Updates the version string in the version info script file.
+    Updates the version string in the main, setup, and version info script files.
 
-    This function reads the version info script file, updates the version string, and writes the updated content back to the file.
+    The three files are independent, so they are updated concurrently to overlap their disk I/O.
     """
 
-    versionParts = VERSION.split(".")
-    versionTuple = tuple(int(versionPart) for versionPart in versionParts) + (0,) * (4 - len(versionParts))
-
-    with open(file=versionInfoScript, mode="r+", encoding="utf-8") as fileDescriptor:
-        lines = fileDescriptor.readlines()
-
-        fileDescriptor.seek(0)
-        fileDescriptor.truncate()
-
-        for line in lines:
-            if "filevers=" in line:
-                fileDescriptor.write(f"{TAB_CHAR}filevers={versionTuple},\n")
-            elif "prodvers=" in line:
-                fileDescriptor.write(f"{TAB_CHAR}prodvers={versionTuple},\n")
-            elif 'StringStruct("FileVersion"' in line:
-                fileDescriptor.write(
-                    f'{TAB_CHAR * 6}StringStruct("FileVersion", "{VERSION}"),  # Matches "File version"\n'
-                )
-            elif 'StringStruct("ProductVersion"' in line:
-                fileDescriptor.write(
-                    f'{TAB_CHAR * 6}StringStruct("ProductVersion", "{VERSION}"),  # Matches "Product version"\n'
-                )
-            else:
-                fileDescriptor.write(line)
+    with ThreadPoolExecutor(max_workers=len(VERSION_LINES)) as executor:
+        # Consume the results so that any exception raised by an update is propagated
+        list(executor.map(updateVersionLines, VERSION_LINES))
 
 
-def updateVersions() -> None:
-    updateMainScriptVersion()
-    updateSetupScriptVersion()
-    updateVersionInfoScriptVersion()
+def removeTree(path: str) -> None:
+    """
+    Deletes a directory tree, without throwing an error if it does not exist.
+
+    The top-level entries are independent of each other, so they are deleted on a thread pool.
+    Deletion is I/O bound, which lets the threads overlap despite the GIL.
+
+    Arguments:
+        path (str): The directory to delete.
+    """
+
+    import shutil
+
+    def removeEntry(entry: os.DirEntry[str]) -> None:
+        """
+        Deletes a single directory entry, without throwing an error if it can't be deleted.
+
+        Arguments:
+            entry (os.DirEntry[str]): The entry to delete.
+        """
+
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(path=entry.path, ignore_errors=True)
+        else:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+
+    try:
+        with os.scandir(path) as iterator:
+            entries = list(iterator)
+    except OSError:
+        return
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(removeEntry, entries))
+
+    # Removes the now empty root, along with anything that couldn't be deleted above
+    shutil.rmtree(path=path, ignore_errors=True)
 
 
 def clean() -> None:
@@ -269,43 +338,137 @@ def clean() -> None:
     Cleans up generated files and directories.
 
     This function deletes the generated files and directories, without throwing an error if they do not exist.
+    The PyInstaller cache lives outside of the generated directory and is kept.
     """
-    shutil.rmtree(path=generatedPath, ignore_errors=True)
-    shutil.rmtree(path=setupOutputPath, ignore_errors=True)
 
+    removeTree(generatedPath)
+    removeTree(setupOutputPath)
 
-def runCommand(command: list[str], errorMessage: str | None = None) -> None:
+
+def runCommand(command: list[str], errorMessage: str | None = None, stream: bool = True) -> None:
     """
     Runs a command and prints its output.
 
     Arguments:
         command (list[str]): The command to run.
         errorMessage (str | None, optional): An error message to print if the command fails. Defaults to None.
+        stream (bool, optional): Print the output live while the command runs, otherwise print it once the command
+        exits. Defaults to True.
     """
 
     stderr = []
 
-    def streamReader(pipe: TextIO, file: TextIO) -> None:
+    def formatLine(line: str, file: TextIO) -> str:
+        """
+        Formats a single output line of the command for a file.
+
+        If the file is sys.stderr, the line is colored red and prefixed with "[!] ".
+        If the file is not sys.stderr, the line is prefixed with "[*] ".
+
+        Arguments:
+            line (str): The line to format.
+            file (TextIO): The file the line will be printed to.
+
+        Returns:
+            str: The formatted line, including its trailing newline.
+        """
+
+        line = line.strip()
+
+        if file == sys.stderr:
+            stderr.append(line)
+            return ERROR_LINE_PREFIX + line + ERROR_LINE_SUFFIX
+
+        return OUTPUT_LINE_PREFIX + line + "\n"
+
+    def printLines(lines: list[bytes], file: TextIO) -> None:
+        """
+        Prints a batch of raw output lines of the command to a file with a single write and flush.
+
+        Arguments:
+            lines (list[bytes]): The lines to print.
+            file (TextIO): The file to print the lines to.
+        """
+
+        if lines:
+            file.write("".join(formatLine(line.decode(encoding="utf-8", errors="replace"), file) for line in lines))
+            file.flush()
+
+    def splitChunk(pending: bytearray, chunk: bytes) -> list[bytes]:
+        """
+        Splits a chunk read from a pipe into complete lines.
+
+        The incomplete tail of the chunk is kept in pending until the rest of the line arrives.
+        An empty chunk marks EOF and returns whatever is left without a trailing newline.
+
+        Arguments:
+            pending (bytearray): The incomplete line left over from the previous chunk.
+            chunk (bytes): The chunk read from the pipe.
+
+        Returns:
+            list[bytes]: The complete lines.
+        """
+
+        if not chunk:
+            lines = [bytes(pending)] if pending else []
+            pending.clear()
+            return lines
+
+        pending.extend(chunk)
+        *lines, remainder = pending.split(b"\n")
+        pending[:] = remainder
+
+        return lines
+
+    def streamReader(pipe: BinaryIO, file: TextIO) -> None:
         """
         Streams the output of a pipe to a file.
 
-        This function reads the output of a pipe and prints it to a file, with optional colorization.
+        This function reads the output of a pipe in raw chunks and prints it to a file, with optional colorization.
         If the file is sys.stderr, the output is colored red and prefixed with "[!] ".
-        If the file is not sys.stderr, the output is colored green and prefixed with "[*] ".
+        If the file is not sys.stderr, the output is prefixed with "[*] ".
 
         Arguments:
-            pipe (TextIO): The pipe to read from.
+            pipe (BinaryIO): The pipe to read from.
             file (TextIO): The file to print the output to.
         """
 
+        pending = bytearray()
+
         with pipe:
-            for line in iter(pipe.readline, ""):
-                if file == sys.stderr:
-                    stderr.append(line.strip())
-                    error = colorize(f"[!] {line.strip()}", foreground=RED)
-                    print(error, file=file, flush=True)
-                else:
-                    print(f"[*] {line.strip()}", file=file, flush=True)
+            while chunk := os.read(pipe.fileno(), PIPE_CHUNK_SIZE):
+                printLines(splitChunk(pending, chunk), file)
+
+            printLines(splitChunk(pending, b""), file)
+
+    def selectReader(pid: subprocess.Popen[bytes]) -> None:
+        """
+        Streams the stdout and stderr of a process on the calling thread.
+
+        This function multiplexes both pipes with a selector instead of draining each one on its own thread.
+        The pipes are read in raw chunks and split into lines, so it never blocks on one pipe while the other fills up.
+        Pipes can only be selected on POSIX systems.
+
+        Arguments:
+            pid (subprocess.Popen[bytes]): The process to stream the output of.
+        """
+
+        import selectors
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(pid.stdout, selectors.EVENT_READ, (sys.stdout, bytearray()))
+            selector.register(pid.stderr, selectors.EVENT_READ, (sys.stderr, bytearray()))
+
+            while selector.get_map():
+                for key, _ in selector.select():
+                    file, pending = key.data
+                    chunk = os.read(key.fd, PIPE_CHUNK_SIZE)
+
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+
+                    printLines(splitChunk(pending, chunk), file)
 
     def printException(message: str) -> None:
         """
@@ -325,31 +488,47 @@ def runCommand(command: list[str], errorMessage: str | None = None) -> None:
         print(error, file=sys.stderr)
 
     try:
-        pid = subprocess.Popen(
-            command,
-            stdout=PIPE,
-            stderr=PIPE,
-            text=True,  # Automatically decode bytes to strings
-            bufsize=1,  # Line buffered
-            universal_newlines=True,
-        )
+        if stream:
+            pid = subprocess.Popen(
+                command,
+                stdout=PIPE,
+                stderr=PIPE,
+                pipesize=PIPE_SIZE,  # Keep a chatty child from blocking on a full pipe
+            )
+
+            assert pid.stdout and pid.stderr
 
-        assert pid.stdout and pid.stderr
+            if os.name != "nt":
+                selectReader(pid)
+
+                pid.wait()
+            else:
+                import threading
 
-        stdoutThread = threading.Thread(target=streamReader, args=(pid.stdout, sys.stdout))
-        stderrThread = threading.Thread(target=streamReader, args=(pid.stderr, sys.stderr))
+                stdoutThread = threading.Thread(target=streamReader, args=(pid.stdout, sys.stdout))
+                stderrThread = threading.Thread(target=streamReader, args=(pid.stderr, sys.stderr))
 
-        stdoutThread.start()
-        stderrThread.start()
+                stdoutThread.start()
+                stderrThread.start()
 
-        pid.wait()
+                pid.wait()
 
-        stdoutThread.join()
-        stderrThread.join()
+                stdoutThread.join()
+                stderrThread.join()
 
-        if pid.returncode != 0:
+            returnCode = pid.returncode
+        else:
+            # Short-lived commands don't need live output, so skip the reader threads
+            result = subprocess.run(command, capture_output=True, text=True, check=False)
+
+            sys.stdout.write("".join(formatLine(line, sys.stdout) for line in result.stdout.splitlines()))
+            sys.stderr.write("".join(formatLine(line, sys.stderr) for line in result.stderr.splitlines()))
+
+            returnCode = result.returncode
+
+        if returnCode != 0:
             erroneousCommand = " ".join(command)
-            raise subprocess.CalledProcessError(pid.returncode, erroneousCommand, stderr="\n".join(stderr))
+            raise subprocess.CalledProcessError(returnCode, erroneousCommand, stderr="\n".join(stderr))
 
     except KeyboardInterrupt:
         error = colorize("\nProcess interrupted by user", foreground=RED)
@@ -369,28 +548,109 @@ def runCommand(command: list[str], errorMessage: str | None = None) -> None:
         sys.exit(ex.returncode)
 
 
-def runPyInstaller() -> None:
+def getBuildKey() -> str:
+    """
+    Returns a key identifying all the inputs of the PyInstaller build.
+
+    The key is a SHA-256 digest over the content of every bundled source file, the icon, and the version info file,
+    along with the PyInstaller command line and the Python and PyInstaller versions.
+    """
+
+    import hashlib
+    import importlib.metadata
+
+    try:
+        pyinstallerVersion = importlib.metadata.version("pyinstaller")
+    except importlib.metadata.PackageNotFoundError:
+        pyinstallerVersion = ""
+
+    sourcePaths = [mainScript]
+
+    for packageName in ("controller", "model", "utils"):
+        sourcePaths.extend(sorted(str(path) for path in Path(mainScript).parent.joinpath(packageName).glob("*.py")))
+
+    digest = hashlib.sha256()
+    digest.update("\0".join([sys.version, pyinstallerVersion, *PYINSTALLER_COMMAND]).encode("utf-8"))
+
+    for path in [*sourcePaths, iconPath, versionPath]:
+        digest.update(path.encode("utf-8"))
+
+        with open(file=path, mode="rb") as fileDescriptor:
+            digest.update(hashlib.file_digest(fileDescriptor, "sha256").digest())
+
+    return digest.hexdigest()
+
+
+def runPyInstaller(cleanCache: bool = False) -> None:
     """
     Builds the PyInstaller executable.
 
     This function runs the PyInstaller command with the necessary arguments to build the executable.
+    PyInstaller keeps its cache in a directory that clean() doesn't remove, so dependency scans are reused.
+
+    The build is skipped when the executable exists and none of its inputs changed since it was built.
+
+    Arguments:
+        cleanCache (bool, optional): Clear the PyInstaller cache before building. Defaults to False.
     """
 
-    command = [
-        "pyinstaller",
-        "--onefile",
-        "--console",
-        f"--workpath={workPath}",
-        f"--distpath={distPath}",
-        f"--specpath={generatedPath}",
-        f"--icon={iconPath}",
-        f"--version-file={versionPath}",
-        "--name=PidCat",
-        mainScript,
-    ]
+    buildKey = getBuildKey()
+
+    if not cleanCache and os.path.exists(executablePath) and os.path.exists(buildKeyPath):
+        with open(file=buildKeyPath, mode="r", encoding="utf-8") as fileDescriptor:
+            if fileDescriptor.read() == buildKey:
+                print("[✓] Executable is up to date, skipping PyInstaller")
+                return
+
+    os.environ.setdefault("PYINSTALLER_CONFIG_DIR", pyinstallerCachePath)
+
+    command = [*PYINSTALLER_COMMAND[:-1], "--clean", mainScript] if cleanCache else PYINSTALLER_COMMAND
 
     runCommand(command=command, errorMessage="Error occurred while building executable")
 
+    with open(file=buildKeyPath, mode="w", encoding="utf-8") as fileDescriptor:
+        fileDescriptor.write(buildKey)
+
+
+def findIscc(args: CliArgs) -> str | None:
+    """
+    Resolves the Inno Setup Compiler executable.
+
+    Arguments:
+        args (Args): The parsed command-line arguments.
+
+    Returns:
+        str | None: The full path of the Inno Setup Compiler, or None if it can't be found.
+    """
+
+    import shutil
+
+    return shutil.which("iscc" if not args.isccPath else args.isccPath)
+
+
+def printIsccNotFound(isccPath: str, reason: str) -> None:
+    """
+    Prints an error explaining that the Inno Setup Compiler could not be run to sys.stderr.
+
+    Arguments:
+        isccPath (str): The path the Inno Setup Compiler was looked up at.
+        reason (str): The reason the Inno Setup Compiler could not be run.
+    """
+
+    error = colorize(
+        f"[!] Error occurred while building installer: {reason}: '{isccPath}'",
+        foreground=RED,
+    )
+    print(error, file=sys.stderr)
+
+    error = colorize(
+        f"[!] Inno Setup Compiler (iscc) not found at path: '{isccPath}'. "
+        "Please install Inno Setup and ensure 'iscc' is in your system PATH, "
+        "or provide the correct path using the --iscc-path argument.",
+        foreground=RED,
+    )
+    print(error, file=sys.stderr)
+
 
 def runBuildInstaller(args: CliArgs) -> None:
     """
@@ -406,23 +666,9 @@ def runBuildInstaller(args: CliArgs) -> None:
     command = [isccPath, setupScript]
 
     try:
-        runCommand(command=command, errorMessage="Error occurred while building installer")
+        runCommand(command=command, errorMessage="Error occurred while building installer", stream=False)
     except FileNotFoundError as ex:
-        erroneiousPath = isccPath
-
-        error = colorize(
-            f"[!] Error occurred while building installer: {ex}: '{erroneiousPath}'",
-            foreground=RED,
-        )
-        print(error, file=sys.stderr)
-
-        error = colorize(
-            f"[!] Inno Setup Compiler (iscc) not found at path: '{erroneiousPath}'. "
-            "Please install Inno Setup and ensure 'iscc' is in your system PATH, "
-            "or provide the correct path using the --iscc-path argument.",
-            foreground=RED,
-        )
-        print(error, file=sys.stderr)
+        printIsccNotFound(isccPath, str(ex))
 
         sys.exit(ex.errno)
 
@@ -435,10 +681,13 @@ def runInstaller() -> None:
     It searches for the latest installer executable in the setup/Output directory.
     """
 
-    installerPath = str(max(glob.glob(f"{setupOutputPath}/*.exe"), key=os.path.getmtime))
+    with os.scandir(setupOutputPath) as entries:
+        installers = (entry for entry in entries if entry.name.endswith(".exe"))
+        installerPath = max(installers, key=lambda installer: installer.stat().st_mtime).path
+
     command = [installerPath]
 
-    runCommand(command=command, errorMessage="Error occurred while running installer")
+    runCommand(command=command, errorMessage="Error occurred while running installer", stream=False)
 
 
 def main() -> None:
@@ -460,38 +709,50 @@ def main() -> None:
 
     print(f"[*] Building PidCat v{VERSION}...")
 
-    print("[*] Updating version information...")
-    updateVersions()
+    # Each step runs at most once, no matter how many of the options requesting it were combined
+    needsClean = args.clean or args.rebuild or args.reinstall
+    needsExecutable = args.buildExecutable or args.rebuild or args.reinstall
+    needsInstaller = args.buildInstaller or args.reinstall
+    needsInstall = args.install or args.reinstall
 
-    if args.clean:
-        print("[*] Cleaning generated files...")
-        clean()
+    # Only the executable and the installer embed the version, cleaning or installing alone leaves the files untouched
+    needsVersions = needsExecutable or needsInstaller
 
-    if args.rebuild:
-        print("[*] Cleaning generated files...")
-        clean()
-        print("[*] Rebuilding executable...")
-        runPyInstaller()
+    if needsVersions:
+        print("[*] Updating version information...")
 
-    if args.buildExecutable:
-        print("[*] Running PyInstaller...")
-        runPyInstaller()
+    # Cleaning and resolving the Inno Setup Compiler never touch the version files, so they overlap the version update.
+    # Everything after this block depends on the updated versions and runs serially.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        versionsUpdate = executor.submit(updateVersions) if needsVersions else None
+        isccLookup = executor.submit(findIscc, args) if needsInstaller else None
 
-    if args.buildInstaller:
-        print("[*] Building installer...")
-        runBuildInstaller(args)
+        if needsClean:
+            print("[*] Cleaning generated files...")
+            clean()
 
-    if args.install:
-        print("[*] Running installer...")
-        runInstaller()
+        if versionsUpdate is not None:
+            versionsUpdate.result()
+
+    # Fail before spending time on PyInstaller if the installer can't be built anyway
+    if isccLookup is not None:
+        isccPath = isccLookup.result()
 
-    if args.reinstall:
-        print("[*] Cleaning generated files...")
-        clean()
-        print("[*] Rebuilding executable...")
-        runPyInstaller()
+        if isccPath is None:
+            printIsccNotFound("iscc" if not args.isccPath else args.isccPath, os.strerror(errno.ENOENT))
+            sys.exit(errno.ENOENT)
+
+        args.isccPath = isccPath
+
+    if needsExecutable:
+        print("[*] Rebuilding executable..." if args.rebuild or args.reinstall else "[*] Running PyInstaller...")
+        runPyInstaller(cleanCache=args.rebuild)
+
+    if needsInstaller:
         print("[*] Building installer...")
         runBuildInstaller(args)
+
+    if needsInstall:
         print("[*] Running installer...")
         runInstaller()
 
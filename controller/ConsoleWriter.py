@@ -11,14 +11,25 @@ class ConsoleWriter(Writer):
     """Configuration for color output."""
 
     def __init__(self, width: int, showColors: bool) -> None:
-        import io
+        # Only wrap stdout when it doesn't already encode to UTF-8, the extra layer costs a copy per write
+        self.ownsStdout = not sys.stdout.encoding.lower().startswith("utf")
+
+        if self.ownsStdout:
+            import io
+
+            self.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+        else:
+            self.stdout = sys.stdout
 
-        self.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
         super().__init__(width=width, showColors=showColors, outputFile=self.stdout, isWrappable=True)
 
+        # Bind the stream methods directly, skipping a Python-level call per emitted line
+        self.write = self.stdout.write
+        self.flush = self.stdout.flush
+
     @override
     def write(self, text: str) -> None:
-        self.stdout.write(f"{text}")
+        self.stdout.write(text)
 
     @override
     def flush(self) -> None:
@@ -27,5 +38,7 @@ class ConsoleWriter(Writer):
     @override
     def close(self) -> None:
         self.stdout.flush()
-        self.stdout.detach()
+
+        if self.ownsStdout:
+            self.stdout.detach()
 
@@ -12,9 +12,13 @@ class FileWriter(Writer):
     def __init__(self, width: int, outputFile: TextIO) -> None:
         super().__init__(width=width, showColors=False, outputFile=outputFile, isWrappable=False)
 
+        # Bind the file methods directly, skipping a Python-level call per emitted line
+        self.write = outputFile.write
+        self.flush = outputFile.flush
+
     @override
     def write(self, text: str) -> None:
-        self.outputFile.write(f"{text}")
+        self.outputFile.write(text)
 
     @override
     def flush(self) -> None:
@@ -1,6 +1,7 @@
-from typing import List
+from typing import FrozenSet
 from typing import Dict
 from typing import Optional
+from typing import Callable
 from dataclasses import dataclass
 
 
@@ -12,5 +13,9 @@ class State:
     lastTag: Optional[str]
     appPID: Optional[str]
     logLevel: int
-    namedProcesses: List[str]
-    catchallPackage: List[str]
+    namedProcesses: FrozenSet[str]
+    catchallPackage: FrozenSet[str]
+    tagMatcher: Optional[Callable[[str], bool]] = None
+    ignoreTagMatcher: Optional[Callable[[str], bool]] = None
+    messageMatcher: Optional[Callable[[str], bool]] = None
+    consoleResized: bool = False
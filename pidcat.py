@@ -1,23 +1,28 @@
 import re
 import sys
 import shutil
+import signal
 import argparse
 
+from io import TextIOWrapper
 from pathlib import Path
+from functools import lru_cache
+from collections import OrderedDict
+from types import FrameType
 
 from subprocess import PIPE
 from subprocess import run as processRun
 from subprocess import Popen as ProcessOpen
 
-from typing import Set
 from typing import List
 from typing import Dict
 from typing import Tuple
+from typing import FrozenSet
 from typing import Optional
+from typing import Callable
 
 from model.State import State
 from model.CliArgs import CliArgs
-from model.MockTTY import MockTTY
 
 from utils.terminalColors import RED
 from utils.terminalColors import BLUE
@@ -40,15 +45,36 @@ VERSION = "2.6.1"
 # --- CONSTANTS and GLOBALS ---
 LOG_LEVELS = "VDIWEF"
 LOG_LEVELS_MAP = {level: index for index, level in enumerate(LOG_LEVELS)}
+LEVEL_FOREGROUNDS = {"V": WHITE, "D": BLACK, "I": BLACK, "W": BLACK, "E": BLACK, "F": BLACK}
+LEVEL_BACKGROUNDS = {"V": BLACK, "D": BLUE, "I": GREEN, "W": YELLOW, "E": RED, "F": RED}
+LEVEL_STRINGS = {
+    level: colorize(f" {level} ", LEVEL_FOREGROUNDS[level], LEVEL_BACKGROUNDS[level]) for level in LOG_LEVELS
+}
 
-LAST_USED = [
-    RED,
-    BLUE,
-    CYAN,
-    GREEN,
-    YELLOW,
-    MAGENTA,
-]
+# Lines between terminal width checks where resizes can't be signaled
+WIDTH_POLL_INTERVAL = 256
+
+# Kernel buffer size of the adb logcat pipe, lets adb keep writing through bursts while a line is being formatted
+LOGCAT_PIPE_SIZE = 1024 * 1024
+
+# Tags of the lines that report process starts and ends, besides "Start proc" messages
+PROCESS_EVENT_TAGS = ("ActivityManager", "dalvikvm")
+
+# Column indices in the output of `ps`
+PS_PID_COLUMN = 1
+PS_NAME_COLUMN = 8
+
+# Colors ordered from least to most recently used
+LAST_USED = OrderedDict.fromkeys(
+    [
+        RED,
+        BLUE,
+        CYAN,
+        GREEN,
+        YELLOW,
+        MAGENTA,
+    ]
+)
 
 KNOWN_TAGS = {
     "jdwp": WHITE,
@@ -73,7 +99,7 @@ SYSTEM_TAGS = [
     r"PreCache",
     r"PlayCore",
     r"BpBinder",
-    r"VRI\[.*?\]",
+    r"VRI\[[^\]]*\]",
     r"AudioTrack",
     r"ImeTracker",
     r"cutils-dev",
@@ -91,7 +117,7 @@ SYSTEM_TAGS = [
     r"SurfaceControl",
     r"\[UAH_CLIENT\]",
     r"DisplayManager",
-    r"AdrenoGLES-.*?",
+    r"AdrenoGLES-.*",
     r"VelocityTracker",
     r"OplusBracketLog",
     r"PipelineWatcher",
@@ -110,8 +136,7 @@ SYSTEM_TAGS = [
     r"OplusGraphicsEvent",
     r"OplusAppHeapManager",
     r"FirebaseCrashlytics",
-    r"FirebaseInitProvider"
-    r"ViewRootImplExtImpl",
+    r"FirebaseInitProvider",
     r"BufferQueueConsumer",
     r"BufferQueueProducer",
     r"OplusCursorFeedback",
@@ -120,7 +145,7 @@ SYSTEM_TAGS = [
     r"CompatChangeReporter",
     r"SessionsDependencies",
     r"OplusInputMethodUtil",
-    r"BufferPoolAccessor.*?",
+    r"BufferPoolAccessor.*",
     r"OplusViewDebugManager",
     r"WindowOnBackDispatcher",
     r"CompactWindowAppManager",
@@ -128,7 +153,7 @@ SYSTEM_TAGS = [
     r"ResourcesManagerExtImpl",
     r"ScrollOptimizationHelper",
     r"OplusActivityThreadExtImpl",
-    r"DynamicFramerate\s*\[.*?\]",
+    r"DynamicFramerate\s*\[[^\]]*\]",
     r"OplusViewDragTouchViewHelper",
     r"OplusPredictiveBackController",
     r"OplusSystemUINavigationGesture",
@@ -137,21 +162,60 @@ SYSTEM_TAGS = [
     r"oplus\.android\.OplusFrameworkFactoryImpl",
 ]
 
+# Characters that make a tag filter a regex pattern instead of a plain substring
+REGEX_CHARS = r".*+?[]{}()|\^$"
+ESCAPED_CHAR = re.compile(r"\\(\W)")
+
+# Plain system tags are looked up by name, only the few with wildcards go through one anchored alternation
+SYSTEM_TAG_NAMES = frozenset(
+    ESCAPED_CHAR.sub(r"\1", systemTag)
+    for systemTag in SYSTEM_TAGS
+    if not any(mChar in ESCAPED_CHAR.sub("", systemTag) for mChar in REGEX_CHARS)
+)
+SYSTEM_TAGS_LINE = re.compile(
+    "^(?:"
+    + "|".join(systemTag for systemTag in SYSTEM_TAGS if ESCAPED_CHAR.sub(r"\1", systemTag) not in SYSTEM_TAG_NAMES)
+    + ")$"
+)
+
 NO_COLOR = re.compile(r"\033\[.*?m")
 BACKTRACE_LINE = re.compile(r"^#(.*?)pc\s(.*?)$")
-NATIVE_TAGS_LINE = re.compile(r".*nativeGetEnabledTags.*")
-LOG_LINE = re.compile(r"^([A-Z])/(.+?)\( *(\d+)\): (.*?)$")
-PID_KILL = re.compile(r"^Killing (\d+):([a-zA-Z0-9._:]+)/[^:]+: (.*)$")
-PID_LEAVE = re.compile(r"^No longer want ([a-zA-Z0-9._:]+) \(pid (\d+)\): .*$")
-PID_DEATH = re.compile(r"^Process ([a-zA-Z0-9._:]+) \(pid (\d+)\) has died.?$")
-PID_LINE = re.compile(r"^\w+\s+(\w+)\s+\w+\s+\w+\s+\w+\s+\w+\s+\w+\s+\w\s(.*?)$")
-PID_START = re.compile(r"^.*: Start proc (\d+):([a-zA-Z0-9._:]+)/[a-z0-9]+ for (.*)$")
-PID_START_UGID = re.compile(r"^.*: Start proc ([a-zA-Z0-9._:]+) for ([a-z]+ [^:]+): pid=(\d+) uid=(\d+) gids=(.*)$")
-PID_START_DALVIK = re.compile(r"^E/dalvikvm\(\s*(\d+)\): >>>>> ([a-zA-Z0-9._:]+) \[ userId:0 \| appId:(\d+) \]$")
+# Lines hold no newline, so a greedy tail takes the whole message without a lazy expansion per character
+LOG_LINE = re.compile(r"^([A-Z])/(.+?)\( *(\d+)\): (.*)")
+
+# Process start and end lines are each matched with a single alternation, the named group of the alternative that
+# matched tells which line format it was. The alternatives are tried in order, just like separate patterns would be.
+# The start patterns run on the message only, the log line prefix is already split off by LOG_LINE.
+PID_START = re.compile(
+    r"^(?:"
+    + r"(?P<start>(?:.*: )?Start proc (?P<startPID>\d+):(?P<startPackage>[a-zA-Z0-9._:]+)/[a-z0-9]+ "
+    + r"for (?P<startTarget>.*))"
+    + r"|(?P<ugid>(?:.*: )?Start proc (?P<ugidPackage>[a-zA-Z0-9._:]+) for (?P<ugidTarget>[a-z]+ [^:]+): "
+    + r"pid=(?P<ugidPID>\d+) uid=(?P<ugidUID>\d+) gids=(?P<ugidGIDs>.*))"
+    + r")$"
+)
+PID_START_DALVIK = re.compile(r"^>>>>> ([a-zA-Z0-9._:]+) \[ userId:0 \| appId:(\d+) \]$")
+PID_END = re.compile(
+    r"^(?:"
+    + r"(?P<kill>Killing (?P<killPID>\d+):(?P<killPackage>[a-zA-Z0-9._:]+)/[^:]+: .*)"
+    + r"|(?P<leave>No longer want (?P<leavePackage>[a-zA-Z0-9._:]+) \(pid (?P<leavePID>\d+)\): .*)"
+    + r"|(?P<death>Process (?P<deathPackage>[a-zA-Z0-9._:]+) \(pid (?P<deathPID>\d+)\) has died.?)"
+    + r")$"
+)
+VISIBLE_ACTIVITIES_HEADER = "VisibleActivityProcess:["
 VISIBLE_ACTIVITIES = re.compile(
     r"VisibleActivityProcess\:\[\s*(?:(?:ProcessRecord\{\w+\s*\d+\:(?:[a-zA-Z.]+)\/\w+\})\s*)+\]"
 )
 VISIBLE_PACKAGES = re.compile(r"ProcessRecord\{\w+\s*\d+\:([a-zA-Z.]+)\/\w+\}")
+STRICT_MODE_LINE = re.compile(r"^(StrictMode policy violation)(; ~duration=)(\d+ ms)")
+GC_LINE = re.compile(
+    r"^(GC_(?:CONCURRENT|FOR_M?ALLOC|EXTERNAL_ALLOC|EXPLICIT) )"
+    + r"(freed <?\d+.)(, \d+\% free \d+./\d+., )(paused \d+ms(?:\+\d+ms)?)"
+)
+
+# Replacements for the message rules above, they only depend on constants
+STRICT_MODE_COLORS = r"\1%s\2%s\3%s" % (termColor(RED), termColor(YELLOW), RESET)
+GC_COLORS = r"\1%s\2%s\3%s\4%s" % (termColor(GREEN), RESET, termColor(YELLOW), RESET)
 
 
 def getArgParser() -> argparse.ArgumentParser:
@@ -366,42 +430,56 @@ def getConsoleWidth() -> int:
 def getWrappedIndent(message: str, width: int, headerSize: int) -> str:
     """Wraps and indents long log messages."""
 
-    if width == -1:
-        return message
-
-    message = message.replace("\t", "    ")
     wrapArea = width - headerSize
-    messageBuffer = ""
-    current = 0
-
-    while current < len(message):
-        nextIndex = min(current + wrapArea, len(message))
-        messageBuffer += message[current:nextIndex]
 
-        if nextIndex < len(message):
-            messageBuffer += "\n"
-            messageBuffer += " " * headerSize
+    # range() can't step by zero, and there's no room to wrap into anyway
+    if width == -1 or wrapArea <= 0:
+        return message
 
-        current = nextIndex
+    message = message.replace("\t", "    ")
+    indent = "\n" + " " * headerSize
 
-    return messageBuffer
+    return indent.join(message[current : current + wrapArea] for current in range(0, len(message), wrapArea))
 
 
 def getTagColor(tag: str) -> int:
     """Allocates a unique color for a tag based on LRU."""
 
     if tag not in KNOWN_TAGS:
-        KNOWN_TAGS[tag] = LAST_USED[0]
+        KNOWN_TAGS[tag] = next(iter(LAST_USED))
 
     color = KNOWN_TAGS[tag]
 
     if color in LAST_USED:
-        LAST_USED.remove(color)
-        LAST_USED.append(color)
+        LAST_USED.move_to_end(color)
 
     return color
 
 
+@lru_cache(maxsize=1024)
+def getColumnText(text: str, width: int, alignRight: bool = False) -> str:
+    """Truncates a column's text to its width and pads it to fill the column."""
+
+    if len(text) > width:
+        text = f"{text[: width - 3]}..."
+
+    return text.rjust(width) if alignRight else text.ljust(width)
+
+
+@lru_cache(maxsize=1024)
+def getColoredColumnText(text: str, width: int, color: int, alignRight: bool = False) -> str:
+    """Builds a column's truncated and padded text wrapped in its color."""
+
+    return colorize(getColumnText(text, width, alignRight), color)
+
+
+@lru_cache(maxsize=16)
+def getHeaderBar(width: int, background: int) -> str:
+    """Builds the colored bar shown in the header of process start and end messages."""
+
+    return colorize(" " * width, background=background)
+
+
 def getAdbCommand(args: CliArgs) -> List[str]:
     """Constructs the base adb command list."""
 
@@ -431,102 +509,96 @@ def getCurrentAppPackage(baseAdbCommand: List[str]) -> Optional[List[str]]:
 
     systemDump = processRun(systemDumpCommand, stdout=PIPE, stderr=PIPE, text=True, errors="replace").stdout
 
-    visibleActivities = re.search(VISIBLE_ACTIVITIES, systemDump)
+    # Only try the regex where the literal block header is, instead of scanning the whole dump with it.
+    visibleActivities = None
+    blockStart = systemDump.find(VISIBLE_ACTIVITIES_HEADER)
+
+    while blockStart >= 0 and not visibleActivities:
+        visibleActivities = VISIBLE_ACTIVITIES.match(systemDump, blockStart)
+        blockStart = systemDump.find(VISIBLE_ACTIVITIES_HEADER, blockStart + 1)
 
     if not visibleActivities:
         return None
 
-    visiblePackages = re.findall(VISIBLE_PACKAGES, visibleActivities.group())
+    visiblePackages = VISIBLE_PACKAGES.findall(systemDump, visibleActivities.start(), visibleActivities.end())
 
     return visiblePackages if visiblePackages else None
 
 
-def getProcesses(baseAdbCommand: List[str], catchallPackage: List[str], args: CliArgs) -> Dict[str, str]:
+def getProcesses(baseAdbCommand: List[str], catchallPackage: FrozenSet[str], args: CliArgs) -> Dict[str, str]:
     """Populates initial PIDs map {PID: PackageName} for catch-all packages or all processes if args.all is True."""
 
     pidsMap = {}
     psCommand = baseAdbCommand + ["shell", "ps"]
 
-    psPid = ProcessOpen(psCommand, stdin=PIPE, stdout=PIPE, stderr=PIPE)
-    psStdout = psPid.stdout
+    psOutput = processRun(psCommand, stdout=PIPE, stderr=PIPE, text=True, errors="replace").stdout
 
-    while True and psStdout:
-        line = psStdout.readline().decode("utf-8", "replace").strip()
+    for line in psOutput.splitlines():
+        # ps prints whitespace separated columns: USER PID PPID VSZ RSS WCHAN ADDR S NAME
+        columns = line.split(None, PS_NAME_COLUMN)
 
-        if not line:
-            break
+        # Skips the header and anything that isn't a full process row
+        if len(columns) <= PS_NAME_COLUMN or not columns[PS_PID_COLUMN].isdigit():
+            continue
 
-        pidMatch = PID_LINE.match(line)
+        pid = columns[PS_PID_COLUMN]
+        process = columns[PS_NAME_COLUMN].strip()
 
-        if pidMatch is not None:
-            pid = pidMatch.group(1)
-            process = pidMatch.group(2)
+        isTargetPackage = process in catchallPackage
 
-            isTargetPackage = process in catchallPackage
-
-            # If not using -a, only add targeted packages
-            if args.all or isTargetPackage:
-                pidsMap[pid] = process  # Store {PID: PackageName}
+        # If not using -a, only add targeted packages
+        if args.all or isTargetPackage:
+            pidsMap[pid] = process  # Store {PID: PackageName}
 
     return pidsMap
 
 
 def getDeadProcesses(
-    tag: str, message: str, pidsSet: Set[str], namedProcesses: List[str], catchallPackage: List[str]
+    tag: str, message: str, pidsMap: Dict[str, str], namedProcesses: FrozenSet[str], catchallPackage: FrozenSet[str]
 ) -> Tuple[Optional[str], Optional[str]]:
     """Parses log lines for process death and removal."""
 
     if tag != "ActivityManager":
         return None, None
 
-    for regex in (PID_KILL, PID_LEAVE, PID_DEATH):
-        match = regex.match(message)
+    match = PID_END.match(message)
 
-        if match:
-            # PID_KILL/PID_LEAVE/PID_DEATH have different group indices
-            if regex == PID_KILL:
-                pid = match.group(1)
-                packageLine = match.group(2)
-            elif regex == PID_LEAVE:
-                pid = match.group(2)
-                packageLine = match.group(1)
-            else:  # PID_DEATH
-                pid = match.group(2)
-                packageLine = match.group(1)
+    if match:
+        # The outer group of the matched alternative closes last
+        kind = match.lastgroup
+        pid = match[f"{kind}PID"]
+        packageLine = match[f"{kind}Package"]
 
-            if isMatchingPackage(packageLine, namedProcesses, catchallPackage) and pid in pidsSet:
-                return pid, packageLine
+        if isMatchingPackage(packageLine, namedProcesses, catchallPackage) and pid in pidsMap:
+            return pid, packageLine
 
     return None, None
 
 
-def getStartedProcesses(line: str) -> Optional[Tuple[str, str, str, str, str]]:
+def getStartedProcesses(level: str, tag: str, owner: str, message: str) -> Optional[Tuple[str, str, str, str, str]]:
     """Parses log lines for process start."""
 
-    for regex in (PID_START, PID_START_UGID, PID_START_DALVIK):
-        match = regex.match(line)
+    # Process start lines either mention "Start proc" or are dalvikvm errors, skip the regexes for everything else
+    if "Start proc" in message:
+        match = PID_START.match(message)
+
+        if not match:
+            return None
 
-        if match:
-            if regex == PID_START:
-                startedPackage = ""
-                startedPID = ""
-                startedPID, startedPackage, startedTarget = match.groups()
+        # The outer group of the matched alternative closes last
+        if match.lastgroup == "start":
+            return match["startPID"], "", "", match["startPackage"], match["startTarget"]
+        else:  # ugid
+            return match["ugidPID"], match["ugidUID"], match["ugidGIDs"], match["ugidPackage"], match["ugidTarget"]
+    elif level == "E" and tag == "dalvikvm":
+        match = PID_START_DALVIK.match(message)
 
-                return startedPID, "", "", startedPackage, startedTarget
-            elif regex == PID_START_UGID:
-                (
-                    startedPackage,
-                    startedTarget,
-                    startedPID,
-                    startedUID,
-                    startedGIDs,
-                ) = match.groups()
+        if not match:
+            return None
 
-                return startedPID, startedUID, startedGIDs, startedPackage, startedTarget
-            else:  # PID_START_DALVIK
-                startedPID, startedPackage, startedUID = match.groups()
+        startedPackage, startedUID = match.groups()
 
-                return startedPID, startedUID, "", startedPackage, ""
+        return owner, startedUID, "", startedPackage, ""
 
     return None
 
@@ -545,21 +617,32 @@ def writeLogLine(line: str, state: State, args: CliArgs, writers: List[Writer])
     tagWidth = args.tagWidth
     currentHeaderSize = 0
 
-    def writeOutput(outputLine: str, wrap: bool = False) -> None:
-        buffer = ""
+    def writeOutput(outputLine: str, wrap: bool = False, plainLine: Optional[str] = None) -> None:
+        # Writers that don't show colors get the plain text, either given alongside the colored text or stripped here
+        # when the text actually holds escape codes
+        if plainLine is None:
+            plainLine = NO_COLOR.sub("", outputLine) if "\033" in outputLine else outputLine
+
         for writer in writers:
+            buffer = outputLine if writer.showColors else plainLine
+
             if wrap and writer.isWrappable:
-                buffer = getWrappedIndent(outputLine, writer.width, currentHeaderSize)
-            else:
-                buffer = outputLine
+                buffer = getWrappedIndent(buffer, writer.width, currentHeaderSize)
 
-            lineNoColor = NO_COLOR.sub("", buffer)
-            showColors = writer.showColors
-            writer.write(buffer if showColors else lineNoColor)
-            writer.flush()
+            writer.write(buffer)
 
-    nativeTags = NATIVE_TAGS_LINE.match(line)
-    if nativeTags:
+    # A plain substring test is enough, the pattern only looked for the marker anywhere in the line
+    if "nativeGetEnabledTags" in line:
+        return
+
+    # Reject lines below the minimum level straight from their "L/" prefix, before running any regex.
+    # Lines that may start or end a process are still parsed, the PID map has to follow them at any level.
+    if (
+        line[1:2] == "/"
+        and LOG_LEVELS_MAP.get(line[0], logLevel) < logLevel
+        and not line.startswith(PROCESS_EVENT_TAGS, 2)
+        and "Start proc" not in line
+    ):
         return
 
     logLine = LOG_LINE.match(line)
@@ -568,7 +651,7 @@ def writeLogLine(line: str, state: State, args: CliArgs, writers: List[Writer])
 
     level, tag, owner, message = logLine.groups()
     tag = tag.strip()
-    startedProcess = getStartedProcesses(line)
+    startedProcess = getStartedProcesses(level, tag, owner, message)
 
     # Calculate current base header size (level + spaces)
     baseLevelSize = 3 + 1  # Level width + space
@@ -584,16 +667,16 @@ def writeLogLine(line: str, state: State, args: CliArgs, writers: List[Writer])
             currentHeaderSize = (packageWidth + 2 if args.showPackage else 0) + args.tagWidth + baseLevelSize
 
             writeOutput("\n")
-            writeOutput(colorize(" " * (currentHeaderSize - 1), background=WHITE))
+            writeOutput(getHeaderBar(currentHeaderSize - 1, WHITE), plainLine=getColumnText("", currentHeaderSize - 1))
             writeOutput(f" Process {startedPackage} created for {startedTarget}\n", wrap=True)
 
-            writeOutput(colorize(" " * (currentHeaderSize - 1), background=WHITE))
+            writeOutput(getHeaderBar(currentHeaderSize - 1, WHITE), plainLine=getColumnText("", currentHeaderSize - 1))
             writeOutput(f" PID: {startedPID}   UID: {startedUID}   GIDs: {startedGIDs}")
             writeOutput("\n")
 
             lastTag = None
 
-    deadPID, deadProcName = getDeadProcesses(tag, message, set(pidsMap.keys()), namedProcesses, catchallPackage)
+    deadPID, deadProcName = getDeadProcesses(tag, message, pidsMap, namedProcesses, catchallPackage)
     if deadPID:
         if deadPID in pidsMap:
             del pidsMap[deadPID]
@@ -601,7 +684,7 @@ def writeLogLine(line: str, state: State, args: CliArgs, writers: List[Writer])
         currentHeaderSize = (packageWidth + 2 if args.showPackage else 0) + args.tagWidth + baseLevelSize
 
         writeOutput("\n")
-        writeOutput(colorize(" " * (currentHeaderSize - 1), background=RED))
+        writeOutput(getHeaderBar(currentHeaderSize - 1, RED), plainLine=getColumnText("", currentHeaderSize - 1))
         writeOutput(f" Process {deadProcName} (PID: {deadPID}) ended")
         writeOutput("\n")
 
@@ -611,20 +694,25 @@ def writeLogLine(line: str, state: State, args: CliArgs, writers: List[Writer])
     if not args.all and owner not in pidsMap:
         return
 
-    if level in LOG_LEVELS_MAP and LOG_LEVELS_MAP[level] < logLevel:
+    # Unknown levels are never filtered
+    if LOG_LEVELS_MAP.get(level, logLevel) < logLevel:
         return
 
-    if args.ignoreTag and isMatchingTag(tag, args.ignoreTag):
+    if state.ignoreTagMatcher and state.ignoreTagMatcher(tag):
         return
 
-    if args.tag and not isMatchingTag(tag, args.tag):
+    if state.tagMatcher and not state.tagMatcher(tag):
+        return
+
+    if state.messageMatcher and not state.messageMatcher(message):
         return
 
     # Handle Backtrace for native crashes
     if tag == "DEBUG":
-        btLine = BACKTRACE_LINE.match(message.lstrip())
+        strippedMessage = message.lstrip()
+        btLine = BACKTRACE_LINE.match(strippedMessage)
         if btLine is not None:
-            message = message.lstrip()
+            message = strippedMessage
             owner = appPid  # Associate backtrace with the app PID
 
     # lineBuffer = ""
@@ -634,25 +722,25 @@ def writeLogLine(line: str, state: State, args: CliArgs, writers: List[Writer])
     if args.showPID and owner:
         pidColor = getTagColor(owner)
 
-        if len(owner) > pidWidth:
-            owner = f"{owner[: pidWidth - 3]}..."
-        pidDisplay = owner.ljust(pidWidth)
+        pidDisplay = getColumnText(owner, pidWidth)
 
-        writeOutput(colorize(pidDisplay, pidColor))
+        writeOutput(getColoredColumnText(owner, pidWidth, pidColor), plainLine=pidDisplay)
         writeOutput("  ")  # Two spaces separator
         currentHeaderSize += pidWidth + 2
     # ----------------------------
 
     # --- PACKAGE NAME SECTION ---
     if args.showPackage and owner:
-        packageName = pidsMap.get(owner, f"UNKNOWN({owner})")
+        # Only build the placeholder name for PIDs that aren't mapped, instead of formatting it on every line
+        packageName = pidsMap.get(owner)
+        if packageName is None:
+            packageName = f"UNKNOWN({owner})"
+
         pkgColor = getTagColor(packageName)
 
-        if len(packageName) > packageWidth:
-            packageName = f"{packageName[: packageWidth - 3]}..."
-        pkgDisplay = packageName.ljust(packageWidth)
+        pkgDisplay = getColumnText(packageName, packageWidth)
 
-        writeOutput(colorize(pkgDisplay, pkgColor))
+        writeOutput(getColoredColumnText(packageName, packageWidth, pkgColor), plainLine=pkgDisplay)
         writeOutput("  ")  # Two spaces separator
         currentHeaderSize += packageWidth + 2
     # ----------------------------
@@ -663,44 +751,30 @@ def writeLogLine(line: str, state: State, args: CliArgs, writers: List[Writer])
             lastTag = tag
             color = getTagColor(tag)
 
-            if len(tag) > tagWidth:
-                tag = f"{tag[: tagWidth - 3]}..."
-            tag = tag.rjust(tagWidth) if args.showPackage else tag.ljust(tagWidth)
+            tagDisplay = getColumnText(tag, tagWidth, alignRight=args.showPackage)
 
-            writeOutput(colorize(tag, color))
+            writeOutput(getColoredColumnText(tag, tagWidth, color, alignRight=args.showPackage), plainLine=tagDisplay)
         else:
-            writeOutput(" " * tagWidth)
+            writeOutput(getColumnText("", tagWidth))  # Blank tag column
 
         writeOutput(" ")
         currentHeaderSize += tagWidth + 1
     # ----------------------------
 
     # --- LEVEL SECTION ---
-    foreground = {"V": WHITE, "D": BLACK, "I": BLACK, "W": BLACK, "E": BLACK, "F": BLACK}.get(level, WHITE)
-    background = {"V": BLACK, "D": BLUE, "I": GREEN, "W": YELLOW, "E": RED, "F": RED}.get(level, BLACK)
-    levelStr = colorize(f" {level} ", foreground, background)
-    writeOutput(levelStr)
+    levelStr = LEVEL_STRINGS.get(level) or colorize(f" {level} ", WHITE, BLACK)
+    writeOutput(levelStr, plainLine=f" {level} ")
     writeOutput(" ")
     currentHeaderSize += baseLevelSize  # Level width + space
     # ----------------------------
 
     # --- MESSAGE SECTION --- (apply rules)
-    messageRules = {}
+    # The rules only add colors, skip them when every writer would strip them again
+    if any(writer.showColors for writer in writers):
+        message = STRICT_MODE_LINE.sub(STRICT_MODE_COLORS, message)
 
-    # StrictMode rule
-    STRICT_MODE = re.compile(r"^(StrictMode policy violation)(; ~duration=)(\d+ ms)")
-    messageRules[STRICT_MODE] = r"\1%s\2%s\3%s" % (termColor(RED), termColor(YELLOW), RESET)
-
-    # GC coloring rule
-    if args.colorGC:
-        COLOR_GC = re.compile(
-            r"^(GC_(?:CONCURRENT|FOR_M?ALLOC|EXTERNAL_ALLOC|EXPLICIT) )"
-            + r"(freed <?\d+.)(, \d+\% free \d+./\d+., )(paused \d+ms(?:\+\d+ms)?)"
-        )
-        messageRules[COLOR_GC] = r"\1%s\2%s\3%s\4%s" % (termColor(GREEN), RESET, termColor(YELLOW), RESET)
-
-    for matcher in messageRules:
-        message = matcher.sub(messageRules[matcher], message)
+        if args.colorGC:
+            message = GC_LINE.sub(GC_COLORS, message)
 
     writeOutput(message, wrap=True)
     writeOutput("\n")
@@ -711,7 +785,7 @@ def writeLogLine(line: str, state: State, args: CliArgs, writers: List[Writer])
     state.appPID = appPid
 
 
-def isMatchingPackage(token: str, namedProcesses: List[str], catchallPackage: List[str]) -> bool:
+def isMatchingPackage(token: str, namedProcesses: FrozenSet[str], catchallPackage: FrozenSet[str]) -> bool:
     """Checks if a process token matches any of the package filters."""
 
     if not catchallPackage and not namedProcesses:
@@ -725,19 +799,67 @@ def isMatchingPackage(token: str, namedProcesses: List[str], catchallPackage: Li
     return (token in catchallPackage) if index == -1 else (token[:index] in catchallPackage)
 
 
-def isMatchingTag(tag: str, tags: List[str]) -> bool:
-    """Checks if a tag matches any of the given tag regex patterns."""
+def getLiteralPrefix(pattern: str) -> str:
+    """Returns the literal text that every match of a regex pattern has to start with."""
+
+    # Any branch of an alternation may match, so there's no common prefix to rely on
+    if "|" in pattern:
+        return ""
+
+    pattern = pattern.removeprefix("^")
 
-    for mTag in map(str.strip, tags):
-        # If the pattern contains regex special chars, treat as regex
-        if any(mChar in mTag for mChar in r".*+?[]{}()|\^$") and re.match(rf"{mTag}", tag):
-            return True
+    for index, char in enumerate(pattern):
+        if char in REGEX_CHARS:
+            # A quantifier may drop the character before it
+            return pattern[: max(index - 1, 0)] if char in "*?{" else pattern[:index]
 
-        # Otherwise, do substring matching (contains)
-        elif mTag in tag:
-            return True
+    return pattern
 
-    return False
+
+def isSystemTag(tag: str) -> bool:
+    """Checks if a tag is one of the known system tags."""
+
+    return tag in SYSTEM_TAG_NAMES or SYSTEM_TAGS_LINE.match(tag) is not None
+
+
+def getTagMatcher(tags: List[str], includeSystemTags: bool = False) -> Callable[[str], bool]:
+    """Builds a predicate that checks if a tag matches any of the given tag patterns, or optionally a system tag."""
+
+    tags = [mTag.strip() for mTag in tags]
+
+    # If the pattern contains regex special chars, it is also matched as regex, compile those once up front.
+    # A tag that doesn't start with the pattern's literal prefix can't match it, so that is checked first.
+    patterns = [
+        (getLiteralPrefix(mTag), re.compile(mTag))
+        for mTag in tags
+        if any(mChar in mTag for mChar in REGEX_CHARS)
+    ]
+
+    def isMatchingTag(tag: str) -> bool:
+        """Checks if a tag matches any of the tag patterns, either as a substring (contains) or as regex."""
+
+        return (
+            (includeSystemTags and isSystemTag(tag))
+            or any(mTag in tag for mTag in tags)
+            or any(tag.startswith(prefix) and pattern.match(tag) for prefix, pattern in patterns)
+        )
+
+    return isMatchingTag
+
+
+def getMessageMatcher(pattern: str) -> Callable[[str], bool]:
+    """Builds a predicate that checks if a message contains a match of the given regex pattern."""
+
+    # Every match contains the pattern's literal prefix, so messages without it are rejected before the regex runs
+    prefix = getLiteralPrefix(pattern)
+    regex = re.compile(pattern)
+
+    def isMatchingMessage(message: str) -> bool:
+        """Checks if the message contains the literal prefix and a match of the pattern."""
+
+        return prefix in message and regex.search(message) is not None
+
+    return isMatchingMessage
 
 
 def main() -> None:
@@ -765,9 +887,6 @@ def main() -> None:
         consoleWriter = ConsoleWriter(width=consoleWidth, showColors=not args.noColor)
         writers = list[Writer]([consoleWriter])
 
-        if args.ignoreSystemTags:
-            args.ignoreTag = [f"^{systemTag.strip()}$" for systemTag in SYSTEM_TAGS]
-
         if args.tag:
             args.tag = [tag.strip() for tag_arg in args.tag for tag in tag_arg.split(",")]
 
@@ -790,6 +909,11 @@ def main() -> None:
         if args.regex:
             adbCommand.extend(["-e", args.regex])
 
+        # Let adb drop lines below the minimum level before they leave the device.
+        # The tags reporting process starts and ends stay at every level, the PID map has to follow them.
+        if logLevel > LOG_LEVELS_MAP["V"]:
+            adbCommand.extend([f"{eventTag}:V" for eventTag in PROCESS_EVENT_TAGS] + [f"*:{LOG_LEVELS[logLevel]}"])
+
         if packages:
             print(f"Capturing logcat messages from packages: [{', '.join(packages)}]...")
         else:
@@ -797,13 +921,29 @@ def main() -> None:
             print("Capturing logcat messages...")
 
         # Determine exact processes vs. catch-all packages
-        catchallPackage = list(filter(lambda package: package.find(":") == -1, packages))
-        namedProcesses = list(filter(lambda package: package.find(":") != -1, packages))
-        namedProcesses = list(map(lambda package: package[:-1] if package.endswith(":") else package, namedProcesses))
+        # Sets, since every process start and end line is checked against them
+        catchallPackage = frozenset(package for package in packages if ":" not in package)
+        namedProcesses = frozenset(package.removesuffix(":") for package in packages if ":" in package)
         pidsMap = getProcesses(baseAdbCommand, catchallPackage, args)
 
-        adbPID = ProcessOpen(adbCommand, stdout=PIPE, stderr=PIPE) if sys.stdin.isatty() else MockTTY()
-        logStream = adbPID.stdout
+        # Read from adb when run interactively, otherwise read the log piped into stdin.
+        # Both streams decode to str, so the loop below doesn't need to tell them apart.
+        # adb already filters its output with the message regex, a piped log has to be filtered here instead.
+        messageMatcher = None
+
+        if sys.stdin.isatty():
+            adbPID = ProcessOpen(
+                adbCommand,
+                stdout=PIPE,
+                stderr=PIPE,
+                encoding="utf-8",
+                errors="replace",
+                pipesize=LOGCAT_PIPE_SIZE,
+            )
+            logStream = adbPID.stdout
+        else:
+            logStream = TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+            messageMatcher = getMessageMatcher(args.regex) if args.regex else None
 
         state = State(
             pidsMap=pidsMap,
@@ -812,26 +952,45 @@ def main() -> None:
             logLevel=logLevel,
             namedProcesses=namedProcesses,
             catchallPackage=catchallPackage,
+            tagMatcher=getTagMatcher(args.tag) if args.tag else None,
+            ignoreTagMatcher=(
+                getTagMatcher(args.ignoreTag or [], includeSystemTags=args.ignoreSystemTags)
+                if args.ignoreTag or args.ignoreSystemTags
+                else None
+            ),
+            messageMatcher=messageMatcher,
         )
 
-        while adbPID.poll() is None and logStream:
-            rawLine = logStream.readline()
-            if not rawLine:
-                break
+        # Query the terminal width only after a resize instead of before every line.
+        # Windows has no SIGWINCH, so poll it every few lines there instead.
+        watchResize = hasattr(signal, "SIGWINCH")
+        lineCount = 0
+
+        if watchResize:
+
+            def onResize(signalNumber: int, frame: Optional[FrameType]) -> None:
+                state.consoleResized = True
+
+            signal.signal(signal.SIGWINCH, onResize)
 
-            # Check if the stream is binary (like ProcessOpen stdout), which returns bytes
-            if isinstance(rawLine, bytes):
-                line = rawLine.decode(encoding="utf-8", errors="replace").strip()
-            # Otherwise, assume it's a text stream (like sys.stdin), which returns str
-            else:
-                line = str(rawLine).strip()
+        # The stream ends once adb exits and its pipe is drained, no need to poll the process per line
+        for rawLine in iter(logStream.readline, "") if logStream else ():
+            line = rawLine.strip()
 
             # Update the writers width if changed
-            for writer in writers:
+            lineCount += 1
+            if state.consoleResized or (not watchResize and lineCount % WIDTH_POLL_INTERVAL == 0):
+                state.consoleResized = False
                 consoleWidth = getConsoleWidth()
-                writer.width = consoleWidth
+
+                for writer in writers:
+                    writer.width = consoleWidth
 
             writeLogLine(line=line, state=state, args=args, writers=writers)
+
+            # Flush once per log line instead of once per fragment, so each line costs a single write
+            for writer in writers:
+                writer.flush()
     except KeyboardInterrupt:
         print(f"\n\n\n{Path(parser.prog).stem} stopped by user!", file=sys.stderr)
     finally: